@@ -1,6 +1,7 @@
 from functools import partial
 from typing import Callable
 
+from zoloto.cameras.marker import MarkerCamera
 from zoloto.marker import Marker
 
 
@@ -8,20 +9,27 @@ def get_uncached_marker_func(marker: Marker, func: str) -> partial:
     return partial(getattr(marker.__class__, func).func, marker)
 
 
-def test_marker_distance(benchmark: Callable, marker: Marker) -> None:
-    benchmark(get_uncached_marker_func(marker, "distance"))
+def test_marker_tvec_derived(benchmark: Callable, marker: Marker) -> None:
+    benchmark(get_uncached_marker_func(marker, "_tvec_derived"))
 
 
 def test_marker_pixel_corners(benchmark: Callable, marker: Marker) -> None:
-    benchmark(lambda: marker.pixel_corners)
+    benchmark(get_uncached_marker_func(marker, "pixel_corners"))
 
 
 def test_marker_pixel_centre(benchmark: Callable, marker: Marker) -> None:
     benchmark(get_uncached_marker_func(marker, "pixel_centre"))
 
 
-def test_marker_pose_vectors(benchmark: Callable, marker: Marker) -> None:
-    benchmark(marker._get_pose_vectors.__wrapped__, marker)
+def test_marker_pose_vectors(benchmark: Callable, marker_camera: MarkerCamera) -> None:
+    ids, corners = marker_camera._get_ids_and_corners()
+    lazy_marker = Marker(
+        int(ids[0]),
+        corners[0],
+        marker_camera.get_marker_size(int(ids[0])),
+        marker_camera.get_calibrations(),
+    )
+    benchmark(lazy_marker._calculate_pose_vectors)
 
 
 def test_marker_orientation(benchmark: Callable, marker: Marker) -> None:
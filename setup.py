@@ -16,12 +16,16 @@ setup(
     package_data={"zoloto": ["py.typed"]},
     install_requires=[
         "opencv-contrib-python-headless>=4.0,<4.1",
-        "cached-property>=1.5",
+        "cached-property>=1.5; python_version < '3.8'",
         "pyquaternion>=0.9.2",
     ],
     entry_points={"console_scripts": ["zoloto-preview=zoloto.cli.preview:main"]},
     python_requires=">=3.5",
-    extras_require={"rpi": ["picamera[array]>=1.13"], "viewer": ["Pillow>=7.0.0"]},
+    extras_require={
+        "rpi": ["picamera[array]>=1.13"],
+        "viewer": ["Pillow>=7.0.0"],
+        "json": ["orjson>=3.0; python_version >= '3.7'"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -2,7 +2,7 @@
 Type stubs for cv2.aruco.
 Note that stubs are only written for the parts that we use.
 """
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 from cv2 import aruco_DetectorParameters
 from numpy import array, ndarray
@@ -13,7 +13,7 @@ def DetectorParameters_create() -> aruco_DetectorParameters:
 
 
 def estimatePoseSingleMarkers(
-    corners: List[ndarray],
+    corners: Union[ndarray, List[ndarray]],
     markerLength: int,
     cameraMatrix: Optional[array],
     distCoeffs: Optional[array],
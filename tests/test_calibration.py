@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Callable
 
 import pytest
+from numpy import float64
 
 from zoloto.calibration import (
     SUPPORTED_EXTENSIONS,
@@ -23,6 +24,16 @@ def test_saving_calibrations(
     assert read_params[1].tolist() == original_params[1].tolist()
 
 
+def test_json_calibrations_are_float(make_temp_file: Callable[[str], Path]) -> None:
+    calibrations_file = Path(make_temp_file(".json"))
+    calibrations_file.write_text(
+        "[[[1, 0, 0], [0, 1, 0], [0, 0, 1]], [[0, 0, 0, 0, 0]]]"
+    )
+    params = parse_calibration_file(calibrations_file)
+    assert params.camera_matrix.dtype == float64
+    assert params.distance_coefficients.dtype == float64
+
+
 def test_cant_load_invalid_extension(make_temp_file: Callable[[str], Path]) -> None:
     with pytest.raises(ValueError) as e:
         parse_calibration_file(Path(make_temp_file(".unknown")))
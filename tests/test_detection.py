@@ -8,6 +8,13 @@ from zoloto.cameras.file import ImageFileCamera as BaseImageFileCamera
 from zoloto.marker_type import MarkerType
 
 
+class ImageFileCamera(BaseImageFileCamera):
+    marker_type = MarkerType.DICT_APRILTAG_36H11
+
+    def get_marker_size(self, marker_id: int) -> int:
+        return 100
+
+
 def test_has_data_for_all_images() -> None:
     assert len(IMAGE_DATA) == len(list(TEST_IMAGE_DIR.glob("*.jpg")))
     for filename in IMAGE_DATA.keys():
@@ -16,37 +23,19 @@ def test_has_data_for_all_images() -> None:
 
 @pytest.mark.parametrize("filename", IMAGE_DATA.keys())
 def test_detects_marker_ids(filename: str, snapshot: Any) -> None:
-    class ImageFileCamera(BaseImageFileCamera):
-        marker_type = MarkerType.DICT_APRILTAG_36H11
-
-        def get_marker_size(self, marker_id: int) -> int:
-            return 100
-
     camera = ImageFileCamera(TEST_IMAGE_DIR.joinpath(filename),)
     snapshot.assert_match(sorted(camera.get_visible_markers()))
 
 
 @pytest.mark.parametrize("filename", IMAGE_DATA.keys())
 def test_annotates_frame(filename: str, temp_image_file: Any) -> None:
-    class ImageFileCamera(BaseImageFileCamera):
-        marker_type = MarkerType.DICT_APRILTAG_36H11
-
-        def get_marker_size(self, marker_id: int) -> int:
-            return 100
-
     camera = ImageFileCamera(TEST_IMAGE_DIR.joinpath(filename),)
     camera.save_frame(temp_image_file, annotate=True)
 
 
 @pytest.mark.parametrize("filename", IMAGE_DATA.keys())
 def test_gets_markers(filename: str, snapshot: Any) -> None:
-    class TestCamera(BaseImageFileCamera):
-        marker_type = MarkerType.DICT_APRILTAG_36H11
-
-        def get_marker_size(self, marker_id: int) -> int:
-            return 100
-
-    camera = TestCamera(TEST_IMAGE_DIR.joinpath(filename),)
+    camera = ImageFileCamera(TEST_IMAGE_DIR.joinpath(filename),)
     snapshot.assert_match(
         sorted(
             (
@@ -65,13 +54,7 @@ def test_gets_markers(filename: str, snapshot: Any) -> None:
 
 @pytest.mark.parametrize("filename,camera_name", IMAGE_DATA.items())
 def test_gets_markers_eager(filename: str, camera_name: str, snapshot: Any) -> None:
-    class TestCamera(BaseImageFileCamera):
-        marker_type = MarkerType.DICT_APRILTAG_36H11
-
-        def get_marker_size(self, marker_id: int) -> int:
-            return 100
-
-    camera = TestCamera(
+    camera = ImageFileCamera(
         TEST_IMAGE_DIR.joinpath(filename),
         calibration_file=get_calibration(camera_name),
     )
@@ -99,13 +82,7 @@ def test_gets_markers_eager(filename: str, camera_name: str, snapshot: Any) -> N
 def test_gets_markers_with_calibration(
     filename: str, camera_name: str, snapshot: Any
 ) -> None:
-    class TestCamera(BaseImageFileCamera):
-        marker_type = MarkerType.DICT_APRILTAG_36H11
-
-        def get_marker_size(self, marker_id: int) -> int:
-            return 100
-
-    camera = TestCamera(
+    camera = ImageFileCamera(
         TEST_IMAGE_DIR.joinpath(filename),
         calibration_file=get_calibration(camera_name),
     )
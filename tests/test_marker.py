@@ -1,15 +1,19 @@
 import json
+import weakref
+from types import MemberDescriptorType
 from typing import Any, Optional
 from unittest import TestCase
 from unittest.mock import patch
 
 import ujson
-from pytest import approx, raises
+from cv2 import aruco
+from numpy import array, float32
+from pytest import approx, importorskip, raises
 
 from zoloto.calibration import CalibrationParameters
 from zoloto.cameras.marker import MarkerCamera as BaseMarkerCamera
 from zoloto.exceptions import MissingCalibrationsError
-from zoloto.marker import Marker
+from zoloto.marker import Marker, _pose_math
 from zoloto.marker_type import MarkerType
 
 
@@ -45,9 +49,20 @@ class MarkerTestCase(TestCase):
         )
         self.assertEqual(bl, (border_size, self.MARKER_SIZE + border_size - 1))
 
+    def test_pixel_corners_cached(self) -> None:
+        self.assertIsInstance(self.marker.pixel_corners, tuple)
+        self.assertIs(self.marker.pixel_corners, self.marker.pixel_corners)
+
+    def test_pixel_corners_dtype(self) -> None:
+        pixel_corners = self.marker._Marker__pixel_corners  # type: ignore
+        self.assertEqual(pixel_corners.dtype, float32)
+        self.assertEqual(pixel_corners.shape, (4, 2))
+
     def test_pixel_centre(self) -> None:
         tl, _, br, _ = self.marker.pixel_corners
         self.assertEqual(self.marker.pixel_centre, (139, 139))
+        for coordinate in self.marker.pixel_centre:
+            self.assertIsInstance(coordinate, int)
 
     def test_distance(self) -> None:
         self.assertEqual(self.marker.distance, 992)
@@ -79,6 +94,24 @@ class MarkerTestCase(TestCase):
         self.assertEqual(marker_dict["size"], self.MARKER_SIZE)
         self.assertEqual(marker_dict["id"], self.MARKER_ID)
 
+    def test_as_dict_cached(self) -> None:
+        marker_dict = self.marker.as_dict()
+        self.assertEqual(marker_dict, self.marker.as_dict())
+        self.assertIsNot(marker_dict, self.marker.as_dict())
+
+    def test_as_dict_mutation_is_isolated(self) -> None:
+        expected_marker_dict = json.loads(json.dumps(self.marker.as_dict()))
+        marker_dict = self.marker.as_dict()
+        marker_dict["pixel_corners"][0][0] += 1
+        marker_dict["pixel_corners"].append([0, 0])
+        if "tvec" in marker_dict:
+            marker_dict["tvec"][2] /= 1000
+            marker_dict["rvec"].append(0)
+        self.assertEqual(self.marker.as_dict(), expected_marker_dict)
+
+    def test_from_dict_is_eager(self) -> None:
+        self.assertTrue(Marker.from_dict(self.marker.as_dict())._is_eager())
+
     def test_dict_as_json(self) -> None:
         marker_dict = self.marker.as_dict()
         created_marker_dict = json.loads(json.dumps(marker_dict))
@@ -105,6 +138,45 @@ class MarkerTestCase(TestCase):
         self.assertEqual(marker_dict["rvec"], approx(created_marker_dict["rvec"]))
         self.assertEqual(marker_dict["tvec"], approx(created_marker_dict["tvec"]))
 
+    def test_to_json(self) -> None:
+        orjson = importorskip("orjson")
+        self.assertEqual(orjson.loads(self.marker.to_json()), self.marker.as_dict())
+
+    def test_to_json_without_orjson(self) -> None:
+        with patch.dict("sys.modules", {"orjson": None}):
+            with raises(ImportError, match=r"zoloto\[json\]"):
+                self.marker.to_json()
+
+
+class LazyMarkerTestCase(MarkerTestCase):
+    def setUp(self) -> None:
+        class MarkerCamera(BaseMarkerCamera):
+            marker_type = MarkerType.DICT_6X6_50
+
+        self.marker_camera = MarkerCamera(self.MARKER_ID, marker_size=self.MARKER_SIZE)
+        ids, corners = self.marker_camera._get_ids_and_corners()
+        self.markers = [
+            Marker(
+                int(ids[0]),
+                corners[0],
+                self.MARKER_SIZE,
+                self.marker_camera.get_calibrations(),
+            )
+        ]
+        self.marker = self.markers[0]
+
+    def test_is_not_eager(self) -> None:
+        self.assertFalse(self.marker._is_eager())
+
+    def test_calculates_pose_once(self) -> None:
+        with patch(
+            "cv2.aruco.estimatePoseSingleMarkers",
+            wraps=aruco.estimatePoseSingleMarkers,
+        ) as pose_mock:
+            self.assertEqual(self.marker._rvec.tolist(), self.marker._rvec.tolist())
+            self.assertEqual(self.marker._tvec.tolist(), self.marker._tvec.tolist())
+        pose_mock.assert_called_once()
+
 
 class EagerMarkerTestCase(MarkerTestCase):
     def setUp(self) -> None:
@@ -135,6 +207,20 @@ class MarkerFromDictTestCase(EagerMarkerTestCase):
         self.marker = Marker.from_dict(self.markers[0].as_dict())
 
 
+class MarkerFromDictWithCalibrationsTestCase(LazyMarkerTestCase):
+    def setUp(self) -> None:
+        class MarkerCamera(BaseMarkerCamera):
+            marker_type = MarkerType.DICT_6X6_50
+
+        self.marker_camera = MarkerCamera(self.MARKER_ID, marker_size=self.MARKER_SIZE)
+        marker_dict = next(self.marker_camera.process_frame()).as_dict()
+        del marker_dict["rvec"], marker_dict["tvec"]
+        self.markers = [
+            Marker.from_dict(marker_dict, self.marker_camera.get_calibrations())
+        ]
+        self.marker = self.markers[0]
+
+
 class MarkerSansCalibrationsTestCase(MarkerTestCase):
     class TestCamera(BaseMarkerCamera):
         marker_type = MarkerType.DICT_6X6_50
@@ -172,6 +258,9 @@ class MarkerSansCalibrationsTestCase(MarkerTestCase):
         self.assertEqual(marker_dict["size"], self.MARKER_SIZE)
         self.assertEqual(marker_dict["id"], self.MARKER_ID)
 
+    def test_from_dict_is_eager(self) -> None:
+        self.assertFalse(Marker.from_dict(self.marker.as_dict())._is_eager())
+
     def test_dict_as_ujson(self) -> None:
         marker_dict = self.marker.as_dict()
         created_marker_dict = ujson.loads(ujson.dumps(marker_dict))
@@ -195,3 +284,96 @@ class MarkerSansCalibrationsFromDictTestCase(MarkerSansCalibrationsTestCase):
 
     def test_is_not_eager(self) -> None:
         self.assertFalse(self.marker._is_eager())
+
+
+class MarkerBatchTestCase(TestCase):
+    MARKER_SIZE = 200
+    MARKER_ID = 25
+
+    def setUp(self) -> None:
+        class MarkerCamera(BaseMarkerCamera):
+            marker_type = MarkerType.DICT_6X6_50
+
+        self.marker_camera = MarkerCamera(self.MARKER_ID, marker_size=self.MARKER_SIZE)
+        self.calibration_params = self.marker_camera.get_calibrations()
+        self.ids, self.corners = self.marker_camera._get_ids_and_corners()
+
+    def test_estimates_pose_once(self) -> None:
+        with patch(
+            "cv2.aruco.estimatePoseSingleMarkers",
+            wraps=aruco.estimatePoseSingleMarkers,
+        ) as pose_mock:
+            markers = Marker.from_batch(
+                self.ids * 3,
+                self.corners * 3,
+                self.marker_camera.get_marker_size,
+                self.calibration_params,
+            )
+        pose_mock.assert_called_once()
+        self.assertEqual(len(markers), 3)
+        for marker in markers:
+            self.assertTrue(marker._is_eager())
+            self.assertEqual(marker.distance, 992)
+
+    def test_lazy_estimates_pose_once(self) -> None:
+        with patch(
+            "cv2.aruco.estimatePoseSingleMarkers",
+            wraps=aruco.estimatePoseSingleMarkers,
+        ) as pose_mock:
+            markers = Marker.from_batch(
+                self.ids * 3,
+                self.corners * 3,
+                self.marker_camera.get_marker_size,
+                self.calibration_params,
+                eager=False,
+            )
+            pose_mock.assert_not_called()
+            for marker in markers:
+                self.assertFalse(marker._is_eager())
+                self.assertEqual(marker.distance, 992)
+        pose_mock.assert_called_once()
+
+    def test_without_calibrations(self) -> None:
+        markers = Marker.from_batch(
+            self.ids, self.corners, self.marker_camera.get_marker_size
+        )
+        self.assertEqual(len(markers), 1)
+        self.assertFalse(markers[0]._is_eager())
+
+
+class MarkerSlotsTestCase(TestCase):
+    SLOT_ATTRIBUTES = [
+        "_Marker__id",
+        "_Marker__pixel_corners",
+        "_Marker__size",
+        "_Marker__camera_calibration_params",
+        "_Marker__precalculated_vectors",
+        "_Marker__pose_batch",
+        "_Marker__pose_cache",
+    ]
+
+    def setUp(self) -> None:
+        self.marker = Marker(25, array([[0, 0], [1, 0], [1, 1], [0, 1]]), 200)
+
+    def test_constructor_attributes_are_slots(self) -> None:
+        for attribute in self.SLOT_ATTRIBUTES:
+            self.assertIsInstance(getattr(Marker, attribute), MemberDescriptorType)
+            self.assertNotIn(attribute, vars(self.marker))
+
+    def test_cached_properties_use_dict(self) -> None:
+        self.assertEqual(self.marker.pixel_corners[0], (0, 0))
+        self.assertIn("pixel_corners", vars(self.marker))
+
+    def test_weak_reference(self) -> None:
+        self.assertIs(weakref.ref(self.marker)(), self.marker)
+
+
+class PoseMathTestCase(TestCase):
+    def test_pose_math(self) -> None:
+        distance, spherical, cartesian = _pose_math(0.0, 3.0, 4.0)
+        self.assertEqual(distance, 5)
+        rot_x, rot_y, dist = spherical
+        self.assertEqual(rot_x, approx(0.6435, abs=1e-4))
+        self.assertEqual(rot_y, 0.0)
+        self.assertEqual(dist, 5)
+        self.assertEqual(cartesian, (0.0, 3.0, 4.0))
@@ -1,7 +1,7 @@
 import pytest
 from cv2 import aruco
 
-from zoloto.marker_type import MarkerType
+from zoloto.marker_type import ALL_MARKER_TYPES, MARKER_TYPE_BY_NAME, MarkerType
 
 EXPECTED_MARKER_TYPES = {
     k.upper() for k, v in aruco.__dict__.items() if k.startswith("DICT_")
@@ -12,8 +12,11 @@ def test_contains_all_dicts() -> None:
     assert {marker.name for marker in MarkerType} == EXPECTED_MARKER_TYPES
 
 
+def test_all_marker_types() -> None:
+    assert ALL_MARKER_TYPES == tuple(MarkerType)
+    assert {marker.name for marker in ALL_MARKER_TYPES} == EXPECTED_MARKER_TYPES
+
+
 @pytest.mark.parametrize("marker_type_name", EXPECTED_MARKER_TYPES)
 def test_has_correct_marker_ids(marker_type_name: str) -> None:
-    assert (
-        getattr(aruco, marker_type_name) == getattr(MarkerType, marker_type_name).value
-    )
+    assert getattr(aruco, marker_type_name) == MARKER_TYPE_BY_NAME[marker_type_name]
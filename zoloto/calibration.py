@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import NamedTuple
 
 from cv2 import FILE_STORAGE_READ, FILE_STORAGE_WRITE, FileStorage, aruco
-from numpy import array
+from numpy import array, float64
 
 from .marker_type import MarkerType
 
@@ -23,7 +23,9 @@ def parse_calibration_file(calibration_file: Path) -> CalibrationParameters:
     file_extension = calibration_file.suffix
     if file_extension == ".json":
         mtx, dist = json.loads(calibration_file.read_text())
-        return CalibrationParameters(array(mtx), array(dist))
+        return CalibrationParameters(
+            array(mtx, dtype=float64), array(dist, dtype=float64)
+        )
     elif file_extension == ".xml":
         storage = FileStorage(str(calibration_file), FILE_STORAGE_READ)
         params = CalibrationParameters(
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from itertools import groupby
 from pathlib import Path
 from typing import Any, Generator, List, Optional, Tuple, TypeVar
 
@@ -76,32 +75,16 @@ class BaseCamera(ABC):
             return [], []
         return [marker_id[0] for marker_id in marker_ids], [c[0] for c in corners]
 
-    def _get_marker(
-        self,
-        marker_id: int,
-        corners: ndarray,
-        calibration_params: Optional[CalibrationParameters],
-    ) -> Marker:
-        return Marker(
-            marker_id, corners, self.get_marker_size(marker_id), calibration_params
-        )
-
-    def _get_eager_marker(
-        self,
-        marker_id: int,
-        corners: ndarray,
-        size: int,
-        calibration_params: Optional[CalibrationParameters],
-        tvec: ndarray,
-        rvec: ndarray,
-    ) -> Marker:
-        return Marker(marker_id, corners, size, calibration_params, (rvec, tvec))
-
     def process_frame(self, *, frame: ndarray = None) -> Generator[Marker, None, None]:
         ids, corners = self._get_ids_and_corners(frame)
         calibration_params = self.get_calibrations()
-        for corners, marker_id in zip(corners, ids):
-            yield self._get_marker(int(marker_id), corners, calibration_params)
+        yield from Marker.from_batch(
+            [int(marker_id) for marker_id in ids],
+            corners,
+            self.get_marker_size,
+            calibration_params,
+            eager=False,
+        )
 
     def process_frame_eager(
         self, *, frame: ndarray = None
@@ -110,20 +93,12 @@ class BaseCamera(ABC):
         if not calibration_params:
             raise MissingCalibrationsError()
         ids, corners = self._get_ids_and_corners(frame)
-
-        def get_marker_size(id_and_corners: Tuple[int, ndarray]) -> int:
-            return self.get_marker_size(id_and_corners[0])
-
-        sorted_corners = sorted(zip(ids, corners), key=get_marker_size)
-        for size, ids_and_corners in groupby(sorted_corners, get_marker_size):
-            ids, corners = zip(*ids_and_corners)
-            rvecs, tvecs, _ = cv2.aruco.estimatePoseSingleMarkers(
-                corners, size, *calibration_params
-            )
-            for marker_id, corners, tvec, rvec in zip(ids, corners, tvecs, rvecs):
-                yield self._get_eager_marker(
-                    int(marker_id), corners, size, calibration_params, tvec[0], rvec[0]
-                )
+        yield from Marker.from_batch(
+            [int(marker_id) for marker_id in ids],
+            corners,
+            self.get_marker_size,
+            calibration_params,
+        )
 
     def get_visible_markers(self, *, frame: ndarray = None) -> List[int]:
         ids, _ = self._get_ids_and_corners(frame)
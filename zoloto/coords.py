@@ -1,9 +1,14 @@
+import sys
 from typing import Iterator, NamedTuple, Tuple
 
-from cached_property import cached_property
 from cv2 import Rodrigues
 from pyquaternion import Quaternion
 
+if sys.version_info >= (3, 8):
+    from functools import cached_property
+else:
+    from cached_property import cached_property
+
 Coordinates = NamedTuple("Coordinates", [("x", float), ("y", float)])
 Coordinates.__doc__ = """
 :param float x: X coordinate
@@ -1,29 +1,107 @@
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from math import atan2, sqrt
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from cached_property import cached_property
 from cv2 import aruco
-from numpy import arctan2, array, linalg, ndarray
+from numpy import asarray, ascontiguousarray, float32, float64, ndarray, newaxis
 
 from .calibration import CalibrationParameters
 from .coords import Coordinates, Orientation, Spherical, ThreeDCoordinates
 from .exceptions import MissingCalibrationsError
 
+if sys.version_info >= (3, 8):
+    from functools import cached_property
+else:
+    from cached_property import cached_property
+
+
+def _estimate_pose_vectors(
+    corners: List[ndarray], sizes: List[int], calibration_params: CalibrationParameters,
+) -> List[Tuple[ndarray, ndarray]]:
+    """
+    Estimate the pose of many markers, with a single pose estimation per marker size.
+    """
+    pose_vectors = {}  # type: Dict[int, Tuple[ndarray, ndarray]]
+    for size in set(sizes):
+        indexes = [i for i, marker_size in enumerate(sizes) if marker_size == size]
+        rvecs, tvecs, _ = aruco.estimatePoseSingleMarkers(
+            [corners[i] for i in indexes],
+            size,
+            calibration_params.camera_matrix,
+            calibration_params.distance_coefficients,
+        )
+        for i, rvec, tvec in zip(indexes, rvecs, tvecs):
+            pose_vectors[i] = (rvec[0], tvec[0])
+    return [pose_vectors[i] for i in range(len(corners))]
+
+
+def _pose_math(
+    x: float, y: float, z: float
+) -> Tuple[int, Tuple[float, float, int], Tuple[float, float, float]]:
+    """
+    Calculate the distance, spherical and cartesian coordinates of a translation.
+    """
+    distance = int(sqrt(x * x + y * y + z * z))
+    return distance, (atan2(y, z), atan2(x, z), distance), (x, y, z)
+
+
+class _PoseBatch:
+    """
+    The poses of all markers in a frame, estimated together when first needed.
+    """
+
+    __slots__ = ("corners", "sizes", "calibration_params", "_pose_vectors")
+
+    def __init__(
+        self,
+        corners: List[ndarray],
+        sizes: List[int],
+        calibration_params: CalibrationParameters,
+    ):
+        self.corners = corners
+        self.sizes = sizes
+        self.calibration_params = calibration_params
+        self._pose_vectors = None  # type: Optional[List[Tuple[ndarray, ndarray]]]
+
+    def get_pose_vectors(self, index: int) -> Tuple[ndarray, ndarray]:
+        if self._pose_vectors is None:
+            self._pose_vectors = _estimate_pose_vectors(
+                self.corners, self.sizes, self.calibration_params
+            )
+        return self._pose_vectors[index]
+
 
 class Marker:
+    # Cached properties need the instance __dict__, so only the constructor
+    # attributes are stored in slots.
+    __slots__ = (
+        "__id",
+        "__pixel_corners",
+        "__size",
+        "__camera_calibration_params",
+        "__precalculated_vectors",
+        "__pose_batch",
+        "__pose_cache",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         marker_id: int,
-        corners: List[ndarray],
+        corners: ndarray,
         size: int,
         calibration_params: Optional[CalibrationParameters] = None,
         precalculated_vectors: Optional[Tuple[ndarray, ndarray]] = None,
+        pose_batch: Optional[Tuple[_PoseBatch, int]] = None,
     ):
         self.__id = marker_id
-        self.__pixel_corners = corners
+        self.__pixel_corners = ascontiguousarray(corners, dtype=float32).reshape(4, 2)
         self.__size = size
         self.__camera_calibration_params = calibration_params
         self.__precalculated_vectors = precalculated_vectors
+        self.__pose_batch = pose_batch
+        self.__pose_cache = None  # type: Optional[Tuple[ndarray, ndarray]]
 
     @property  # noqa: A003
     def id(self) -> int:
@@ -36,46 +114,74 @@ class Marker:
     def _is_eager(self) -> bool:
         return self.__precalculated_vectors is not None
 
-    @property
-    def pixel_corners(self) -> List[Coordinates]:
-        return [Coordinates(*coords) for coords in self.__pixel_corners]
+    @cached_property
+    def pixel_corners(self) -> Tuple[Coordinates, ...]:
+        return tuple(map(Coordinates._make, self.__pixel_corners.tolist()))
 
     @cached_property
     def pixel_centre(self) -> Coordinates:
-        tl, _, br, _ = self.__pixel_corners
+        """
+        The centre of the marker, in whole pixels.
+
+        Sub-pixel positions are truncated; use ``pixel_corners`` if they're needed.
+        """
+        half_size = self.__size // 2
         return Coordinates(
-            x=tl[0] + (self.__size / 2) - 1, y=br[1] - (self.__size / 2),
+            x=int(self.__pixel_corners[0, 0]) + half_size - 1,
+            y=int(self.__pixel_corners[2, 1]) - half_size,
         )
 
-    @cached_property
+    @property
     def distance(self) -> int:
-        return int(linalg.norm(self._tvec))
+        distance, _, _ = self._tvec_derived
+        return distance
 
     @property
     def orientation(self) -> Orientation:
-        return Orientation(*self._rvec)
+        return Orientation(*self._rvec.tolist())
 
-    @cached_property
+    @property
     def spherical(self) -> Spherical:
-        x, y, z = self._tvec
-        return Spherical(rot_x=arctan2(y, z), rot_y=arctan2(x, z), dist=self.distance)
+        _, spherical, _ = self._tvec_derived
+        return spherical
 
     @property
     def cartesian(self) -> ThreeDCoordinates:
-        return ThreeDCoordinates(*self._tvec)
+        _, _, cartesian = self._tvec_derived
+        return cartesian
+
+    @cached_property
+    def _tvec_derived(self) -> Tuple[int, Spherical, ThreeDCoordinates]:
+        """
+        Calculate the distance, spherical and cartesian coordinates together.
+        """
+        distance, spherical, cartesian = _pose_math(*self._tvec.tolist())
+        return (
+            distance,
+            Spherical._make(spherical),
+            ThreeDCoordinates._make(cartesian),
+        )
 
-    @lru_cache(maxsize=None)
     def _get_pose_vectors(self) -> Tuple[ndarray, ndarray]:
+        if self.__pose_cache is None:
+            self.__pose_cache = self._calculate_pose_vectors()
+        return self.__pose_cache
+
+    def _calculate_pose_vectors(self) -> Tuple[ndarray, ndarray]:
         # Check if the Marker is eager.
         # We cannot call _is_eager, else mypy will think we are returning Optional
         if self.__precalculated_vectors is not None:
             return self.__precalculated_vectors
 
+        if self.__pose_batch is not None:
+            pose_batch, index = self.__pose_batch
+            return pose_batch.get_pose_vectors(index)
+
         if self.__camera_calibration_params is None:
             raise MissingCalibrationsError()
 
         rvec, tvec, _ = aruco.estimatePoseSingleMarkers(
-            [self.__pixel_corners],
+            self.__pixel_corners[newaxis],
             self.__size,
             self.__camera_calibration_params.camera_matrix,
             self.__camera_calibration_params.distance_coefficients,
@@ -92,26 +198,114 @@ class Marker:
         _, tvec = self._get_pose_vectors()
         return tvec
 
-    def as_dict(self) -> Dict[str, Any]:
+    @cached_property
+    def _marker_dict(self) -> Dict[str, Any]:
         marker_dict = {
             "id": self.id,
             "size": self.size,
-            "pixel_corners": self.__pixel_corners.tolist(),  # type: ignore
+            "pixel_corners": self.__pixel_corners.tolist(),
         }
         try:
-            marker_dict.update({"rvec": list(self._rvec), "tvec": list(self._tvec)})
+            marker_dict.update(
+                {"rvec": self._rvec.tolist(), "tvec": self._tvec.tolist()}
+            )
         except MissingCalibrationsError:
             pass
         return marker_dict
 
+    def as_dict(self) -> Dict[str, Any]:
+        # Copy the nested lists too, so callers can't modify the cached dict
+        marker_dict = dict(self._marker_dict)
+        marker_dict["pixel_corners"] = [
+            list(corner) for corner in marker_dict["pixel_corners"]
+        ]
+        for vector in ["rvec", "tvec"]:
+            if vector in marker_dict:
+                marker_dict[vector] = list(marker_dict[vector])
+        return marker_dict
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the marker to JSON.
+
+        Requires the ``json`` extra to be installed.
+        """
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "orjson is required to serialize markers to JSON, "
+                "install it with 'pip install zoloto[json]'"
+            ) from e
+
+        return orjson.dumps(self._marker_dict)
+
     @classmethod
-    def from_dict(cls, marker_dict: Dict[str, Any]) -> "Marker":
-        marker_args = [
+    def from_dict(
+        cls,
+        marker_dict: Dict[str, Any],
+        calibration_params: Optional[CalibrationParameters] = None,
+    ) -> "Marker":
+        """
+        Recreate a marker from the output of ``as_dict``.
+
+        Pose vectors in the dict are used as-is. Otherwise, ``calibration_params``
+        allows the pose to be estimated when needed.
+        """
+        precalculated_vectors = None
+        if "rvec" in marker_dict and "tvec" in marker_dict:
+            precalculated_vectors = (
+                asarray(marker_dict["rvec"], dtype=float64),
+                asarray(marker_dict["tvec"], dtype=float64),
+            )
+        return cls(
             marker_dict["id"],
-            array(marker_dict["pixel_corners"]),
+            asarray(marker_dict["pixel_corners"], dtype=float32),
             marker_dict["size"],
-            None,
+            calibration_params,
+            precalculated_vectors,
+        )
+
+    @classmethod
+    def from_batch(
+        cls,
+        marker_ids: List[int],
+        corners: List[ndarray],
+        get_marker_size: Callable[[int], int],
+        calibration_params: Optional[CalibrationParameters] = None,
+        *,
+        eager: bool = True
+    ) -> List["Marker"]:
+        """
+        Create markers for all detections in a frame.
+
+        If calibrations are given, the poses of all markers are estimated together:
+        immediately if ``eager``, otherwise when the first pose is accessed.
+        """
+        sizes = [get_marker_size(marker_id) for marker_id in marker_ids]
+        if calibration_params is None:
+            return [
+                cls(marker_id, marker_corners, size)
+                for marker_id, marker_corners, size in zip(marker_ids, corners, sizes)
+            ]
+        if not eager:
+            pose_batch = _PoseBatch(corners, sizes, calibration_params)
+            return [
+                cls(
+                    marker_id,
+                    marker_corners,
+                    size,
+                    calibration_params,
+                    pose_batch=(pose_batch, i),
+                )
+                for i, (marker_id, marker_corners, size) in enumerate(
+                    zip(marker_ids, corners, sizes)
+                )
+            ]
+        pose_vectors = _estimate_pose_vectors(corners, sizes, calibration_params)
+        return [
+            cls(marker_id, marker_corners, size, calibration_params, vectors)
+            for marker_id, marker_corners, size, vectors in zip(
+                marker_ids, corners, sizes, pose_vectors
+            )
         ]
-        if "rvec" in marker_dict and "tvec" in marker_dict:
-            marker_args.append((array(marker_dict["rvec"]), array(marker_dict["tvec"])))
-        return cls(*marker_args)
@@ -1,4 +1,6 @@
 from enum import IntEnum
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 from cv2 import aruco
 
@@ -25,3 +27,10 @@ class MarkerType(IntEnum):
     DICT_APRILTAG_25H9 = aruco.DICT_APRILTAG_25H9
     DICT_APRILTAG_36H10 = aruco.DICT_APRILTAG_36H10
     DICT_APRILTAG_36H11 = aruco.DICT_APRILTAG_36H11
+
+
+ALL_MARKER_TYPES = tuple(MarkerType)  # type: Tuple[MarkerType, ...]
+
+MARKER_TYPE_BY_NAME = MappingProxyType(
+    {marker_type.name: marker_type for marker_type in ALL_MARKER_TYPES}
+)  # type: Mapping[str, MarkerType]